@@ -0,0 +1,12 @@
+"""This is a simple, text based clone of the video game Slay the Spire,
+by Mega Crit. It is a turn based game where the user fights enemies by
+using a randomised deck of cards representing their possible game
+actions. The player draws 5 cards from their deck at the start of each
+turn and discards their hand at the end of their turn. If they would
+draw a card and their deck is empty, the discard pile is shuffled, and
+becomes the draw pile.
+
+Importing the package has no side effects and loads no game content;
+cards, characters and enemies are looked up through spire.registry, or
+imported from their modules directly. Run the game with python -m spire.
+"""
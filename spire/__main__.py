@@ -0,0 +1,97 @@
+"""Command line entry point, run with python -m spire."""
+
+import argparse
+import contextlib
+import random
+import shutil
+import sys
+
+from . import registry
+from .combat import battle, multibattle
+
+
+def main(argv=None):
+    """Parses the command line arguments and starts a battle.
+
+    argv
+      List of argument strings, defaults to sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(prog='python -m spire',
+                                     description="Text based clone of Slay"
+                                     " the Spire.")
+    parser.add_argument('--character', default='Silent',
+                        help="player character (%(default)s)")
+    parser.add_argument('--enemy', nargs='+', default=['JawWorm'],
+                        help="enemies to battle (%(default)s)")
+    parser.add_argument('--seed', type=int,
+                        help="seed for the random number generator")
+    parser.add_argument('--plain', action='store_true',
+                        help="print the battle line by line instead of"
+                        " using the full-screen display")
+    parser.add_argument('--fast-forward', action='store_true',
+                        help="skip the frames shown after each card and"
+                        " enemy action, and only redraw the screen when"
+                        " input is needed")
+    parser.add_argument('--delay', type=float, default=0.3,
+                        help="seconds each card and enemy action stays on"
+                        " screen before the battle advances (%(default)s)")
+    parser.add_argument('--hint', metavar='TABLE',
+                        help="suggest plays using a win probability table"
+                        " built with python -m spire.oracle, against a"
+                        " single JawWorm")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    try:
+        character = registry.resolve('character', args.character)()
+        enemies = [registry.resolve('enemy', name)() for name in args.enemy]
+    except KeyError as error:
+        parser.error(error.args[0])
+    oracle = None
+    if args.hint is not None:
+        if [name.lower() for name in args.enemy] != ['jawworm']:
+            parser.error("--hint only supports a single JawWorm.")
+        from .oracle import Oracle
+        try:
+            oracle = Oracle(args.hint)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        # The table must cover every hp the battle can reach, or lookups
+        # would fail partway through it.
+        if (oracle.dims['enemy_hp'] < type(enemies[0]).HP_RANGE[1]
+                or oracle.dims['player_hp'] < character.maxhp):
+            oracle.close()
+            parser.error(f"{args.hint} does not cover a {character.name}"
+                         f" with {character.maxhp} hp against a JawWorm"
+                         f" with up to {type(enemies[0]).HP_RANGE[1]} hp.")
+
+    renderer = None
+    if not args.plain and sys.stdout.isatty():
+        from .renderer import TerminalRenderer, curses
+        columns, lines = shutil.get_terminal_size()
+        # Terminals too small for the full-screen display fall back to
+        # printing the battle line by line.
+        if (curses is not None
+                and TerminalRenderer.fits(columns, lines, len(enemies))):
+            renderer = TerminalRenderer(args.fast_forward, args.delay)
+    with contextlib.ExitStack() as stack:
+        if oracle is not None:
+            stack.enter_context(oracle)
+        if renderer is not None:
+            stack.enter_context(renderer)
+        start(character, enemies, renderer, oracle)
+
+
+def start(character, enemies, renderer=None, oracle=None):
+    """Starts a single or multi enemy battle depending on the number of
+    enemies.
+    """
+    if len(enemies) == 1:
+        battle(character, enemies[0], renderer, oracle)
+    else:
+        multibattle(character, enemies, renderer)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+"""Traits and turn logic shared by the player characters and enemies,
+and the damage rules applied between them.
+"""
+
+import math
+import sys
+
+from .piles import discard, draw
+
+class Being:
+    """Includes methods and traits used by both the player character
+       and enemies.
+    """
+    def __init__(self, name, maxhp, hp=0, block=0, strength=0, dexterity=0,
+                  focus=0, vulnerable=0, weak=0, frail=0, ritual=0):
+        self.name = name
+        self.maxhp = maxhp # Maximum hit points.
+        self.hp = maxhp # Current hit points.
+        # Block lasts 1 turn and serves as a buffer for a beings health.
+        self.block = block 
+        # A being with x strength will deal x more damage.
+        self.strength = strength 
+        # A being with x dexterity will gain x more block from cards.
+        self.dexterity = dexterity 
+        self.focus = focus # Currently unused
+        # Vulnerable beings take 50% more damage from attacks.
+        self.vulnerable = vulnerable
+        # Weak beings deal 25% less attack damage.
+        self.weak = weak
+        # Frail beings gain 25% less block from cards.
+        self.frail = frail
+        # A being with x ritual will gain x strength at end of turn.
+        self.ritual = ritual
+        
+    
+    def attack(self, target, dmg, combat=True):
+        """Used to calculate damage and adjust hp of the target which
+        is being attacked by self.
+
+        self
+          Being Source of the attack.
+        target
+          Being target of the attack.
+        dmg
+          int attack amount, unadjusted for modifiers.
+        combat
+          Boolean used to determine how to calculate damage, depending
+          on if source is in combat.
+        """
+        if combat:
+            # Uses truedmgcalc to adjust dmg according to self and
+            # target modifiers.
+            dmg = truedmgcalc(self, dmg, target)
+        if target.block == 0:
+            target.hp -= dmg
+            print(f"{self.name} dealt {dmg} damage to {target.name},"
+                    f" whose health is now {target.hp}.")
+        elif target.block >= dmg:
+            target.block = target.block - dmg
+            print(f"{target.name}\'s block reduced by {dmg}."
+                   f" They have {target.block} block remaining.")
+        else:
+            damagetaken = dmg - target.block
+            target.hp -= damagetaken
+            print(f"{target.name}'s block was broken, and took"
+                    f" {damagetaken} damage.")
+            target.block = 0
+        # Checks whether target dies from the attack, and ends the
+        # battle if the user dies, or all enemies die.
+        check_status(target)
+
+    def add_block(self, amount, card=True):
+        """Used to calculate block gained, adjusted for Beings traits.
+
+        self
+          Being gaining block.
+        amount
+          int block amount, unadjusted for modifiers.
+        card
+          Boolean used to determine how to calculate block, depending
+          on if coming from a card source.
+        """
+        if card==True:
+            blockadd = amount + self.dexterity
+            if self.frail > 0:
+                blockadd = math.floor(blockadd * 0.75)
+        self.block += blockadd
+        print(f"{self.name} gained {blockadd} block, and now has"
+               f" {self.block} block.")
+
+
+class Character(Being):
+
+    def __init__(self, name, maxhp, hp=0, block=0, strength=0,
+                  dexterity=0, focus=0, vulnerable=0, weak=0, frail=0,
+                    ritual=0, mana_per_turn=3, starting_hand_size=5):
+        super().__init__(name, maxhp, hp, block, strength, dexterity,
+                          focus, vulnerable, weak, frail, ritual)
+        # User's mana resets to this number at the start of their turn.
+        self.mana_per_turn = mana_per_turn
+        # A card's cost is subtracted from this number when played.
+        self.current_mana = mana_per_turn
+        # User draws 5 cards at the start of their turn, and discards
+        # all cards at the end of it.
+        self.starting_hand_size = starting_hand_size
+        self.block = 0
+
+    def start_turn(self, deck, disc, hand, exha):
+        """ Performs the actions that happen at the start of the user's
+        turn, and returns the new state of the user's deck, discard
+        pile, hand and exhaust pile.
+        
+        self
+          Character Current player.
+        deck
+          List Current character deck.
+        disc
+          List Current character discard pile.
+        hand
+          List Current character hand.
+        exha
+          List Current character exhaust pile.
+        """
+        self.block = 0
+        print(f"{self.name}'s block returned to 0.")
+        self.current_mana = self.mana_per_turn
+        print(f"{self.name}'s energy reset to 3.")
+        deck, disc, hand = draw(deck, disc, hand, self.starting_hand_size)
+        return deck, disc, hand, exha
+    
+    def end_turn(self, deck, disc, hand, exha):
+        """ Performs the actions that happen at the end of the user's
+        turn, and returns the new state of the user's deck, discard
+        pile, hand and exhaust pile.
+        
+        self
+          Character Current player.
+        deck
+          List Current character deck.
+        disc
+          List Current character discard pile.
+        hand
+          List Current character hand.
+        exha
+          List Current character exhaust pile.
+        """
+        if self.ritual > 0:
+            self.strength += self.ritual
+            print(f"{self.name}'s ritual increased their strength by"
+                   f" {self.ritual} to {self.strength}.")
+        # The following traits decrement at the end of a being's turn.
+        if self.weak > 0 :
+            self.weak -= 1
+            print(f"{self.name}'s weak decreased by 1 to {self.weak}.")
+        if self.vulnerable > 0 :
+            self.vulnerable -= 1
+            print(f"{self.name}'s weak decreased by 1 to {self.weak}.")
+        if self.frail > 0 :
+            self.frail -= 1
+            print(f"{self.name}'s vulnerable decreased by 1 to {self.weak}.")
+        deck, disc, hand = discard(deck, disc, hand, len(hand))
+        return deck, disc, hand, exha
+
+
+class Enemy(Being):
+    """Each Subclass of Enemy represents a type of enemy in the game."""
+
+    def start_turn(self):
+        """Resets block of enemies at the start of their turn."""
+        self.block = 0
+
+    def end_turn(self):
+        """ Performs the actions that happen at the end of an enemy's
+        turn.
+        
+        self
+          Enemy Enemy within a battle.
+        """
+        if self.ritual > 0:
+            self.strength += self.ritual
+            print(f"{self.name}'s ritual increased their strength by"
+                    f" {self.ritual} to {self.strength}.")
+        if self.weak > 0 :
+            self.weak -= 1
+            print(f"{self.name}'s weak decreased by 1 to {self.weak}.")
+        if self.vulnerable > 0 :
+            self.vulnerable -= 1
+            print(f"{self.name}'s weak decreased by 1 to {self.weak}.")
+        if self.frail > 0 :
+            self.frail -= 1
+            print(f"{self.name}'s vulnerable decreased by 1 to {self.weak}.")
+
+
+def truedmgcalc(source, dmg, target):
+    """calculates damage dealt using an attack's base attack value, and
+    current traits of the attacker and target.
+    
+    source
+      Being Source of the attack.
+    dmg
+      int Attack's raw attack value.
+    target
+      Being Target of the attack.
+    """
+    truedmg = dmg + source.strength
+    if source.weak > 0 and target.vulnerable > 0:
+        truedmg = math.floor(truedmg*1.125)
+    elif source.weak > 0:
+        truedmg = math.floor(truedmg*0.75)
+    elif target.vulnerable > 0:
+        truedmg = math.floor(truedmg*1.5)
+    return truedmg
+
+def check_status(receiver):
+     """Used to check if a target has died after receiving damage, and
+     ends the game if it's the player, or ends the battle if it's an
+     enemy, and all other enemies in the battle are dead.
+
+     receiver
+       Being Being that just took damage.
+     """
+     if receiver.hp <= 0:
+         if isinstance(receiver, Character):
+            print('Game Over!')
+            sys.exit()
+         elif isinstance(receiver, Enemy):
+             print('You Win!')
+             sys.exit()
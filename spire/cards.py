@@ -0,0 +1,105 @@
+"""Card classes playable by the player characters."""
+
+from .piles import discard, draw
+
+class Cards:
+    """Each card class has a cost, name, and description attribute, and
+    is equipped with a method  play() that takes the player character, a
+    target enemy, and the current state of the deck, discard pile, hand,
+    and exhaust pile, and returns the updated deck, discard pile, hand
+    and exhaust pile after the card is played.
+
+    Each card class also is equipped with a constant TARGETS, depending
+    on whether its effect requires a target, and is used to determine
+    whether to prompt the user for input in multi-enemy battles.
+    """
+    pass
+
+class SilentCards(Cards):
+    """Structured like this to allow for future implementation of
+    different characters, with different card sets.
+    """
+    pass
+
+class Strike(SilentCards):
+ 
+    TARGETS = True
+
+    def __init__(self):
+        self.name = "Strike"
+        self.description = "Deal 6 damage."
+        self.cost = 1
+
+    def play(self, character, target, deck, disc, hand, exha):
+        character.attack(target, 6)
+        return deck, disc, hand, exha
+
+class Defend(SilentCards):
+
+    TARGETS = False
+    
+    def __init__(self):
+        self.name = "Defend"
+        self.description = "Gain 5 block."
+        self.cost = 1
+
+    def play(self, character, target, deck, disc, hand, exha):
+        character.add_block(5)
+        return deck, disc, hand, exha
+
+class Survivor(SilentCards):
+
+    TARGETS = False
+
+    def __init__(self):
+        self.name = "Survivor"
+        self.description = "Gain 8 block. Discard a card."
+        self.cost = 1
+
+    def play(self, character, target, deck, disc, hand, exha):
+        character.add_block(8)
+        deck, disc, hand = discard(deck, disc, hand)
+        return deck, disc, hand, exha
+
+class Neutralize(SilentCards):
+
+    TARGETS = True
+
+    def __init__(self):
+        self.name = "Neutralize"
+        self.description = "Deal 3 damage. Apply 1 weak."
+        self.cost = 0
+
+    def play(self, character, target, deck, disc, hand, exha):
+        character.attack(target, 3)
+        target.weak +=1
+        print(f"{target.name} gained 1 weak!")
+        return deck, disc, hand, exha
+    
+class Acrobatics(SilentCards):
+
+    TARGETS = False
+
+    def __init__(self):
+        self.name = "Acrobatics"
+        self.description = "Draw 3 cards. Discard a card."
+        self.cost = 1
+
+    def play(self, character, target, deck, disc, hand, exha):
+        deck, disc, hand = draw(deck, disc, hand, 3)
+        deck, disc, hand = discard(deck, disc, hand)
+        return deck, disc, hand, exha
+    
+class Backflip(SilentCards):
+
+    TARGETS = False
+
+    def __init__(self):
+        self.name = "Backflip"
+        self.description = "Gain 5 block. Draw 2 cards."
+        self.cost = 1
+
+    def play(self, character, target, deck, disc, hand, exha):
+        character.add_block(5)
+        deck, disc, hand = draw(deck, disc, hand, 2)
+        return deck, disc, hand, exha
@@ -0,0 +1,17 @@
+"""Playable characters and their starting decks."""
+
+from .beings import Character
+from .cards import Defend, Neutralize, Strike, Survivor
+
+class Silent(Character):
+    """A player character; contains starting traits and deck."""
+    def __init__(self, name="Silent", maxhp=77, hp=0, block=0, strength=0,
+                  dexterity=0, focus=0, vulnerable=0, weak=0, frail=0,
+                    ritual=0, mana_per_turn=3, starting_hand_size=5):
+        super().__init__(name, maxhp, hp, block, strength, dexterity,
+                          focus, vulnerable, weak, frail, ritual,
+                            mana_per_turn, starting_hand_size)
+        # Creates starting deck.
+        self.deck = [Strike(), Strike(), Strike(), Strike(), Strike(),
+                     Defend(), Defend(), Defend(), Defend(), Defend(),
+                     Survivor(), Neutralize()]
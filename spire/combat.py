@@ -0,0 +1,166 @@
+"""Battle loops between the player character and enemies."""
+
+import random
+
+from .display import print_being, print_card_list, print_hint
+
+def battle(character, enemy, renderer=None, oracle=None):
+    """Starts a battle between the player character and a single enemy.
+    
+    character
+      Character current player character.
+    enemy
+      Enemy an Enemy object.
+    renderer
+      TerminalRenderer used to display the battle, or None to print
+      it line by line.
+    oracle
+      Oracle used to suggest a play and the chance of winning at the
+      start of each turn, or None for no hints. Only supports battles
+      against a JawWorm."""
+    
+    # deck is initialized as a randomised ordering of the characters starting
+    # deck, as some cards are added to deck temporarily for a single battle.
+    deck = random.sample(character.deck, len(character.deck))
+    # disc contains the cards currently in the discard pile.
+    disc = []
+    # hand contains the cards currently in the users hand.
+    hand = []
+    # exha contains the cards currently in the users exhaust pile.
+    exha = []
+    # turn represents the current turn number.
+    turn = 0
+    while True: # Contains battle.
+        deck, disc, hand, exha = character.start_turn(deck, disc, hand, exha)
+        turn += 1
+        actioninfo = enemy.action_intent(character, turn)
+        if renderer is None:
+            print(f"TURN {turn}\n")
+            print_being(enemy) # Prints enemy stats.
+            print(actioninfo[0]) # Prints enemy intent.
+            print_being(character) # Prints character stats.
+        if oracle is not None:
+            played, chance = oracle.hint(character, enemy, hand, deck,
+                                         actioninfo[1], turn)
+            print_hint(played, chance, oracle.card_types)
+        while True: # Contains users turn.
+            if renderer is None:
+                print("Cards in hand:")
+                print_card_list(hand)
+            else:
+                renderer.show_battle(turn, character, [enemy], [actioninfo],
+                                     hand)
+            player_action = input("Enter the index of the card to play it, or"
+                                   " P to end your turn."
+                                f" {character.current_mana} energy remaining.")
+            if player_action in ('P','p','pass','Pass'):
+                break # Ends the users turn.
+            card_index = int(player_action) - 1
+            # Checks if given index is smaller than hand size and that
+            # its corresponding card's cost is affordable.
+            if (0 <= card_index <= len(hand) 
+            and character.current_mana >= hand[card_index].cost):
+                # Plays chosen card.
+                temp = hand.pop(card_index)
+                print(f'Played {temp.name}!')
+                deck, disc, hand, exha = temp.play(character, enemy, deck,
+                                                    disc, hand, exha)
+                character.current_mana -= temp.cost
+                disc.append(temp)
+                if renderer is not None:
+                    renderer.frame()
+            else:
+                print("Invalid input. Please try again.")
+
+        # End player turn.
+        deck, disc, hand, exha = character.end_turn(deck, disc, hand, exha)
+        if renderer is not None:
+            # end_turn leaves the hand in a new list.
+            renderer.show_battle(turn, character, [enemy], [actioninfo], hand)
+
+        # Start enemy turn.
+        enemy.start_turn()
+        # Carry out enemy action.
+        enemy.action(character, actioninfo[1])
+        if renderer is not None:
+            renderer.frame()
+        # End enemy turn.
+        enemy.end_turn()
+        
+
+def multibattle(character, enemylist, renderer=None):
+    """Start a battle between the player character and multiple enemies.
+    
+    character
+      Character current player character.
+    enemylist
+      List a list containing Enemy objects.
+    renderer
+      TerminalRenderer used to display the battle, or None to print
+      it line by line."""
+    
+    deck = random.sample(character.deck, len(character.deck))
+    disc = []
+    hand = []
+    exha = []
+    turn = 0
+    while True:
+        # start player turn
+        deck, disc, hand, exha = character.start_turn(deck, disc, hand, exha)
+        turn += 1
+        actioninfo = []
+        for enemy in enemylist:
+            actioninfo.append(enemy.action_intent(character, turn))
+        if renderer is None:
+            print(f'TURN {turn}\n')
+            print_being(character)
+            print()
+            for i in range(len(enemylist)):
+                print_being(enemylist[i])
+                print(actioninfo[i][0])
+        while True:
+            if renderer is None:
+                print('cards in hand:\n')
+                print_card_list(hand)
+            else:
+                renderer.show_battle(turn, character, enemylist, actioninfo,
+                                     hand)
+            player_action = input("Enter the index of the card to play it, or "
+            f"P to end your turn. {character.current_mana} energy remaining. ")
+            if player_action in ('P','p','pass','Pass'):
+                break
+            card_index = int(player_action) - 1
+            if (0 <= card_index <= len(hand)
+            and character.current_mana >= hand[card_index].cost):
+                temp = hand.pop(card_index)
+                if temp.TARGETS == True:
+                    print("Select target enemy: ")
+                    print_being(enemylist)
+                    target = enemylist[int(input())-1]
+                else:
+                    target = None
+                print(f"Played {temp.name}!")
+                deck, disc, hand, exha = temp.play(character, target, deck,
+                                                    disc, hand, exha)
+                character.current_mana -= temp.cost
+                disc.append(temp)
+                if renderer is not None:
+                    renderer.frame()
+            else:
+                print("Invalid input. Please try again.")
+        deck, disc, hand, exha = character.end_turn(deck, disc, hand, exha)
+        # End player turn.
+        if renderer is not None:
+            # end_turn leaves the hand in a new list.
+            renderer.show_battle(turn, character, enemylist, actioninfo, hand)
+
+        # Start enemy turn.
+        for enemy in enemylist:
+            enemy.start_turn()
+        for enemy in enumerate(enemylist):
+            enemy[1].action(character, actioninfo[enemy[0]][1])
+            if renderer is not None:
+                renderer.frame()
+        for enemy in enemylist:
+            enemy.end_turn()
+        # End enemy turn.
@@ -0,0 +1,74 @@
+"""Plain text display of cards and beings."""
+
+def card_line(index, card):
+    """Returns the line used to display a card in a list of cards.
+
+    index
+      int Position of the card in its list.
+    card
+      Card object to be displayed.
+    """
+    return (f'{index + 1} : {card.name} | cost: {card.cost}'
+            f' | description: {card.description}')
+
+def being_line(being):
+    """Returns the line used to display a beings various stats.
+
+    being
+      Being whose info is to be displayed.
+    """
+    line = f"{being.name} | HP:{being.hp}/{being.maxhp} | Block: {being.block}"
+    if being.strength > 0:
+        line += f" | Strength: {being.strength}"
+    if being.dexterity > 0:
+        line += f" | Dexterity: {being.dexterity}"
+    if being.focus > 0:
+        line += f" | Focus: {being.focus}"
+    if being.vulnerable > 0:
+        line += f" | Vulnerable: {being.vulnerable}"
+    if being.weak > 0:
+        line += f" | Weak: {being.weak}"
+    if being.frail > 0:
+        line += f" | Frail: {being.frail}"
+    if being.ritual > 0:
+        line += f" | Ritual: {being.ritual}"
+    return line
+
+def print_card_list(lis):
+    """Used to print lists of cards for the user to read.
+
+    lis
+      List containing Card objects.
+    """
+    for card in enumerate(lis):
+        print(card_line(card[0], card[1]))
+    print('')
+
+def print_being(being):
+    """Used to print a beings various stats for the user to read.
+
+    being
+      Being whose info is to be displayed. OR
+      List list containing beings whose info is to be displayed.
+    """
+    if type(being) == list:
+        for x in enumerate(being):
+            print(f"{x[0]+1} | {being_line(x[1])}")
+    else:
+        print(being_line(being))
+
+def print_hint(played, chance, names):
+    """Used to print the cards suggested by an Oracle, and the chance of
+    winning if they are played.
+
+    played
+      Tuple Number of each card type to play.
+    chance
+      float Chance of winning.
+    names
+      Tuple Name of each card type, in the same order as played.
+    """
+    cards = [f"{count} {name}" for count, name in zip(played, names)
+             if count]
+    print(f"Hint: play {', '.join(cards) or 'nothing'} for a {chance:.1%}"
+          " chance to win.")
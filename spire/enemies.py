@@ -0,0 +1,131 @@
+"""Enemies the player can be put in battle against."""
+
+import random
+
+from .beings import Enemy, truedmgcalc
+
+class Cultist(Enemy):
+
+    # Range max hp is rolled from.
+    HP_RANGE = (50, 56)
+
+    def __init__(self, name="Cultist", maxhp=None, hp=0,
+                  block=0, strength=0, dexterity=0, focus=0, vulnerable=0,
+                    weak=0, frail=0, ritual=0):
+        # Rolled per instance, rather than once when the class is defined.
+        if maxhp is None:
+            maxhp = random.randint(*self.HP_RANGE)
+        super().__init__(name, maxhp, hp, block, strength, dexterity, focus,
+                          ritual)
+
+    def action_intent(self, target, turn):
+        """Uses the enemy, player character and turn number to determine
+        the action an enemy will take this turn, and returns a tuple
+        containing a string describing its intent and an index
+        associated with that action, later used as an argument for the
+        action method.
+        
+        self
+          Enemy
+        target
+          Character Current player character.
+        turn
+          int Current turn number.
+        """
+        if turn == 1:
+            return (f"{self.name} intends to buff!\n", 0)
+        else:
+            attackingfor = truedmgcalc(self, 1, target)
+            return (f"{self.name} is going to attack you for"
+                     f" {attackingfor} damage!", 1)
+        
+    def action(self, target, act):
+        """Carries out the action associated with the index stored in
+        act.
+
+        self
+          Enemy
+        target
+          Character Current player character.
+        act
+          int Index associated with this turns intent.
+        """
+        if act == 0:
+            self.ritual =+ 5
+            print(f"{self.name} gained 5 ritual!\n")
+        else:
+            attackingfor = truedmgcalc(self, 1, target)
+            self.attack(target, 1)
+
+class JawWorm(Enemy):
+
+    # Range max hp is rolled from.
+    HP_RANGE = (40, 44)
+
+    def __init__(self, name='Jaw Worm', maxhp=None, hp=0,
+                  block=0, strength=0, dexterity=0, focus=0, vulnerable=0,
+                    weak=0, frail=0, ritual=0, lastattack=0, lastlastattack=0):
+        if maxhp is None:
+            maxhp = random.randint(*self.HP_RANGE)
+        super().__init__(name, maxhp, hp, block, strength, dexterity, focus,
+                          ritual)
+        self.lastattack = lastattack
+        self.lastlastattack = lastlastattack
+
+    def action_intent(self, target, turn):
+        """The following logic makes Jaw Worm chomp on turn 1, and
+        on following turns, has a 45% chance to use bellow, 25% chance
+        to use chomp, and 30% chance to use thrash. It also prevents Jaw
+        Worm from using chomp twice in a row, bellow twice in a row, or
+        thrash thrice in a row.
+        """
+        chomp = (f"{self.name} is going to attack you for"
+                    f" {truedmgcalc(self, 11, target)} damage!", 0)
+        thrash = (f"{self.name} is going to block and attack you for"
+                   f" {truedmgcalc(self, 7, target)} damage!", 1)
+        bellow = (f"{self.name} is going to buff and block!", 2)
+        if turn == 1:
+            return chomp
+        outcome = random.random()
+        if self.lastattack == 2:
+            if outcome > 0.45:
+                return thrash
+            else:
+                return chomp
+        elif self.lastattack == 0:
+            if outcome > 0.4:
+                return thrash
+            else:
+                return bellow
+        elif self.lastattack == 1 and self.lastlastattack == 1:
+            if outcome > 0.64:
+                return chomp
+            else:
+                return bellow
+        else:
+            if outcome < 0.45:
+                return bellow
+            elif outcome > 0.75:
+                return chomp
+            else:
+                return thrash
+
+        
+
+    
+    def action(self, target, action): # Chomp
+        if action == 0:
+            self.attack(target, 11)
+            self.lastlastattack = self.lastattack
+            self.lastattack = 0
+        elif action == 1: # Thrash
+            self.attack(target, 7)
+            self.add_block(5)
+            self.lastlastattack = self.lastattack
+            self.lastattack = 1
+        elif action == 2: # Bellow
+            self.strength += 3
+            print(f"{self.name} gained 3 strength!")
+            self.add_block(6)
+            self.lastlastattack = self.lastattack
+            self.lastattack = 2
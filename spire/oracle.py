@@ -0,0 +1,524 @@
+"""Precomputed win probabilities for a battle against a single Jaw Worm.
+
+Between two turns, everything about such a battle that matters for its
+outcome is captured by a small state: the player's hp, the Jaw Worm's
+hp, how many times it has used bellow (its strength), its move history,
+and which cards are left in the draw pile. Its block during the
+player's turn follows from its last move, and the player's block and
+the statuses applied by Neutralize never outlast a turn.
+
+build() solves every such state by backward induction, assuming the
+player plays their cards according to a policy, and writes the win
+probabilities to a lookup table on disk. Oracle memory-maps the table
+so that a battle can query the win probability of any position in
+constant time, without simulating it.
+
+The table covers the Silent's starting deck; build it with
+python -m spire.oracle build PATH, and pass it to python -m spire with
+--hint PATH.
+"""
+
+import array
+import json
+import math
+import mmap
+import sys
+from itertools import product
+
+from . import registry
+
+# Card types the model knows how to play, in the order used for card
+# counts throughout this module.
+CARD_TYPES = ('Strike', 'Defend', 'Survivor', 'Neutralize')
+
+# Jaw Worm moves, matching the action indexes used by JawWorm.
+CHOMP, THRASH, BELLOW = 0, 1, 2
+
+# Jaw Worm move histories that lead to different intents. START is the
+# first turn, and THRASH2 is two thrashes in a row.
+START, AFTER_CHOMP, AFTER_BELLOW, AFTER_THRASH, THRASH2 = range(5)
+
+# INTENTS maps each history to the chance of each move this turn, as
+# rolled by JawWorm.action_intent.
+INTENTS = {
+    START: ((CHOMP, 1.0),),
+    AFTER_CHOMP: ((THRASH, 0.6), (BELLOW, 0.4)),
+    AFTER_BELLOW: ((THRASH, 0.55), (CHOMP, 0.45)),
+    AFTER_THRASH: ((BELLOW, 0.45), (CHOMP, 0.25), (THRASH, 0.3)),
+    THRASH2: ((CHOMP, 0.36), (BELLOW, 0.64)),
+}
+
+# Block the Jaw Worm has during the player's turn, gained from its last
+# move.
+ENEMY_BLOCK = {START: 0, AFTER_CHOMP: 0, AFTER_BELLOW: 6, AFTER_THRASH: 5,
+               THRASH2: 5}
+
+# Base attack damage of each move.
+MOVE_DAMAGE = {CHOMP: 11, THRASH: 7, BELLOW: 0}
+
+MAGIC = b'SPIREDP1'
+# Probabilities are stored as unsigned 16 bit fractions of SCALE.
+SCALE = 65535
+
+
+def greedy_policy(hand, move, strength):
+    """Chooses which cards to play from a hand, and returns the number
+    of each card type played, in CARD_TYPES order.
+
+    Neutralize is always played. When the Jaw Worm is going to attack,
+    Survivor and then as many Defends as needed are played to block the
+    attack, and the remaining energy is spent on Strikes.
+
+    hand
+      Tuple Number of each card type in hand.
+    move
+      int Move the Jaw Worm intends to use this turn.
+    strength
+      int Current strength of the Jaw Worm.
+    """
+    strikes, defends, survivors, neutralizes = hand
+    energy = 3
+    play_neutralize = min(neutralizes, 1)
+    incoming = incoming_damage(move, strength, play_neutralize)
+    play_survivor = play_defend = block = 0
+    if incoming > 0 and survivors:
+        play_survivor = 1
+        energy -= 1
+        block += 8
+    while block < incoming and play_defend < defends and energy:
+        play_defend += 1
+        energy -= 1
+        block += 5
+    play_strike = min(strikes, energy)
+    return play_strike, play_defend, play_survivor, play_neutralize
+
+
+def incoming_damage(move, strength, weak):
+    """Returns the damage a Jaw Worm move deals before block, following
+    truedmgcalc.
+
+    move
+      int Move the Jaw Worm uses.
+    strength
+      int Strength of the Jaw Worm.
+    weak
+      Boolean whether the Jaw Worm is weak.
+    """
+    if move == BELLOW:
+        return 0
+    damage = MOVE_DAMAGE[move] + strength
+    if weak:
+        damage = math.floor(damage * 0.75)
+    return damage
+
+
+def resolve_turn(hand, history, bellows, policy):
+    """Plays out a turn under a policy, and returns a tuple of the
+    damage dealt to the Jaw Worm, the damage dealt to the player and
+    the Jaw Worm move, for each move it may use, with its chance.
+
+    hand
+      Tuple Number of each card type in hand.
+    history
+      int Jaw Worm move history.
+    bellows
+      int Number of times the Jaw Worm has used bellow.
+    policy
+      Function used to choose the cards played, like greedy_policy.
+    """
+    outcomes = []
+    for move, chance in INTENTS[history]:
+        played = policy(hand, move, 3 * bellows)
+        outcomes.append((turn_outcome(played, history, bellows, move),
+                         chance))
+    return outcomes
+
+
+def turn_outcome(played, history, bellows, move):
+    """Returns the damage dealt to the Jaw Worm, the damage dealt to the
+    player, and the move used, when the player plays the cards counted
+    in played against a Jaw Worm using move.
+    """
+    strikes, defends, survivors, neutralizes = played
+    dealt = max(6 * strikes + 3 * neutralizes - ENEMY_BLOCK[history], 0)
+    block = 5 * defends + 8 * survivors
+    taken = max(incoming_damage(move, 3 * bellows, neutralizes) - block, 0)
+    return dealt, taken, move
+
+
+def next_history(history, move):
+    """Returns the Jaw Worm move history after it uses move."""
+    if move == CHOMP:
+        return AFTER_CHOMP
+    if move == BELLOW:
+        return AFTER_BELLOW
+    if history in (AFTER_THRASH, THRASH2):
+        return THRASH2
+    return AFTER_THRASH
+
+
+def deck_counts(cards):
+    """Returns the number of each card type in a list of cards.
+
+    cards
+      List containing Card objects.
+    """
+    counts = [0] * len(CARD_TYPES)
+    for card in cards:
+        if card.name not in CARD_TYPES:
+            raise ValueError(f"{card.name} is not supported by the win"
+                              " probability table.")
+        counts[CARD_TYPES.index(card.name)] += 1
+    return tuple(counts)
+
+
+def _subsets(pile, n):
+    """Yields each hand of n cards that can be drawn from pile, with its
+    chance.
+    """
+    total = math.comb(sum(pile), n)
+    for hand in product(*(range(min(count, n) + 1) for count in pile)):
+        if sum(hand) == n:
+            ways = math.prod(math.comb(count, drawn)
+                             for count, drawn in zip(pile, hand))
+            yield hand, ways / total
+
+
+def draws(pile, deck, hand_size):
+    """Yields each hand that can be drawn at the start of a turn, with
+    the draw pile left afterwards and its chance, following draw().
+
+    pile
+      Tuple Number of each card type in the draw pile.
+    deck
+      Tuple Number of each card type in the whole deck.
+    hand_size
+      int Number of cards drawn.
+    """
+    if sum(pile) >= hand_size:
+        for hand, chance in _subsets(pile, hand_size):
+            yield hand, _minus(pile, hand), chance
+    else:
+        # The draw pile runs out, and the rest of the deck is shuffled
+        # into a new one.
+        rest = _minus(deck, pile)
+        for drawn, chance in _subsets(rest, hand_size - sum(pile)):
+            hand = tuple(a + b for a, b in zip(pile, drawn))
+            yield hand, _minus(rest, drawn), chance
+
+
+def _minus(a, b):
+    return tuple(x - y for x, y in zip(a, b))
+
+
+def reachable_piles(deck, hand_size):
+    """Returns the draw piles that can occur between turns, starting
+    with the whole deck.
+    """
+    piles = [deck]
+    seen = {deck}
+    for pile in piles:
+        for hand, left, chance in draws(pile, deck, hand_size):
+            if left not in seen:
+                seen.add(left)
+                piles.append(left)
+    return piles
+
+
+def build(path, policy='greedy', character='Silent', enemy_maxhp=44,
+          max_bellows=12, log=None):
+    """Solves every battle state against a single Jaw Worm, and writes
+    the win probabilities to path.
+
+    States are solved in an order where every state a turn can lead to
+    is solved first, except for turns where nothing but the move
+    history and draw pile change, which are solved by iterating to a
+    fixed point.
+
+    path
+      str File to write the table to.
+    policy
+      str Name of a policy in the registry, used to choose the cards
+      played each turn.
+    character
+      str Name of the player character in the registry, whose max hp
+      and starting deck are used.
+    enemy_maxhp
+      int Highest Jaw Worm hp covered by the table.
+    max_bellows
+      int Highest number of bellows tracked; further bellows are
+      treated as not increasing the Jaw Worm's strength.
+    log
+      Function called with progress messages, or None.
+    """
+    player = registry.resolve('character', character)()
+    choose = registry.resolve('policy', policy)
+    deck = deck_counts(player.deck)
+    hand_size = player.starting_hand_size
+    piles = reachable_piles(deck, hand_size)
+    pile_index = {pile: i for i, pile in enumerate(piles)}
+    dims = {'bellows': max_bellows + 1, 'histories': len(INTENTS),
+            'piles': len(piles), 'enemy_hp': enemy_maxhp,
+            'player_hp': player.maxhp}
+    php_size, hp_size = player.maxhp, enemy_maxhp * player.maxhp
+    slots = len(INTENTS) * len(piles)
+
+    # For every history, draw pile and number of bellows, outcomes
+    # holds the chance of each result of the turn, merged by the damage
+    # dealt to each side and the slot reached. internal holds the ones
+    # that leave both hps and the strength unchanged.
+    outcomes, internal = {}, {}
+    for bellows in range(max_bellows + 1):
+        for history, pile in product(INTENTS, piles):
+            merged = {}
+            for hand, left, draw_chance in draws(pile, deck, hand_size):
+                for (dealt, taken, move), chance in resolve_turn(
+                        hand, history, bellows, choose):
+                    after = min(bellows + (move == BELLOW), max_bellows)
+                    slot = (after * len(INTENTS) + next_history(history, move)
+                            ) * len(piles) + pile_index[left]
+                    key = (dealt, taken, slot)
+                    merged[key] = merged.get(key, 0) + draw_chance * chance
+            slot = (bellows * len(INTENTS) + history) * len(piles) \
+                + pile_index[pile]
+            outcomes[slot] = [
+                (chance, dealt, taken, nxt * hp_size - dealt * php_size - taken)
+                for (dealt, taken, nxt), chance in merged.items()
+                if not (dealt == 0 and taken == 0
+                        and nxt // slots == bellows)]
+            internal[slot] = [
+                (chance, nxt * hp_size)
+                for (dealt, taken, nxt), chance in merged.items()
+                if dealt == 0 and taken == 0 and nxt // slots == bellows]
+
+    values = array.array('d', bytes(8 * slots * (max_bellows + 1) * hp_size))
+    for bellows in reversed(range(max_bellows + 1)):
+        if log is not None:
+            log(f"Solving states with {bellows} bellows.")
+        layer = range(bellows * slots, (bellows + 1) * slots)
+        cyclic = [slot for slot in layer if internal[slot]]
+        for ehp in range(1, enemy_maxhp + 1):
+            for php in range(1, player.maxhp + 1):
+                offset = (ehp - 1) * php_size + php - 1
+                for slot in layer:
+                    value = 0.0
+                    for chance, dealt, taken, target in outcomes[slot]:
+                        if dealt >= ehp:
+                            value += chance
+                        elif taken < php:
+                            value += chance * values[target + offset]
+                    values[slot * hp_size + offset] = value
+                _settle(values, cyclic, internal, offset, hp_size)
+
+    header = {'policy': policy, 'character': character, 'deck': deck,
+              'hand_size': hand_size, 'piles': piles, 'dims': dims,
+              'byteorder': sys.byteorder}
+    table = array.array('H', (round(value * SCALE) for value in values))
+    with open(path, 'wb') as file:
+        header = json.dumps(header).encode() + b'\n'
+        # Pads the header so that the table starts on an even offset.
+        header += b' ' * ((len(MAGIC) + len(header)) % 2)
+        file.write(MAGIC + header)
+        table.tofile(file)
+
+
+def _settle(values, cyclic, internal, offset, hp_size):
+    """Adds the chance of winning through turns where nothing but the
+    move history and draw pile change, by iterating until the values of
+    the affected states stop changing.
+    """
+    if not cyclic:
+        return
+    base = {slot: values[slot * hp_size + offset] for slot in cyclic}
+    while True:
+        change = 0.0
+        for slot in cyclic:
+            value = base[slot]
+            for chance, target in internal[slot]:
+                value += chance * values[target + offset]
+            index = slot * hp_size + offset
+            change = max(change, abs(value - values[index]))
+            values[index] = value
+        if change < 1e-9:
+            return
+
+
+class Oracle:
+    """Memory-mapped win probability table written by build().
+
+    Used as a context manager, or closed with close() once done.
+
+    path
+      str File the table was written to.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(MAGIC)] != MAGIC:
+            self.map.close()
+            raise ValueError(f"{path} is not a win probability table.")
+        end = self.map.find(b'\n') + 1
+        header = json.loads(self.map[len(MAGIC):end])
+        if header['byteorder'] != sys.byteorder:
+            self.map.close()
+            raise ValueError(f"{path} was built on a machine with a"
+                              " different byte order.")
+        start = end + (end % 2)
+        self.table = memoryview(self.map)[start:].cast('H')
+        self.policy = registry.resolve('policy', header['policy'])
+        self.deck = tuple(header['deck'])
+        self.hand_size = header['hand_size']
+        self.piles = {tuple(pile): i for i, pile in enumerate(header['piles'])}
+        self.dims = header['dims']
+        self.card_types = CARD_TYPES
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        self.table.release()
+        self.map.close()
+
+    def lookup(self, php, ehp, bellows, history, pile):
+        """Returns the chance of winning from the start of a turn,
+        before cards are drawn and the Jaw Worm's intent is rolled.
+
+        php
+          int Player hp.
+        ehp
+          int Jaw Worm hp.
+        bellows
+          int Number of times the Jaw Worm has used bellow.
+        history
+          int Jaw Worm move history, one of START, AFTER_CHOMP,
+          AFTER_BELLOW, AFTER_THRASH or THRASH2.
+        pile
+          Tuple Number of each card type in the draw pile.
+        """
+        if php <= 0:
+            return 0.0
+        if ehp <= 0:
+            return 1.0
+        dims = self.dims
+        if php > dims['player_hp'] or ehp > dims['enemy_hp']:
+            raise ValueError("hp is outside the range of the table.")
+        if pile not in self.piles:
+            raise ValueError(f"Draw pile {pile} is not in the table.")
+        bellows = min(bellows, dims['bellows'] - 1)
+        slot = (bellows * dims['histories'] + history) * dims['piles'] \
+            + self.piles[pile]
+        index = ((slot * dims['enemy_hp'] + ehp - 1) * dims['player_hp']
+                 + php - 1)
+        return self.table[index] / SCALE
+
+    def win_probability(self, character, enemy, deck, turn):
+        """Returns the chance of winning a battle against a Jaw Worm,
+        from the start of the given turn, before cards are drawn.
+
+        character
+          Character current player character.
+        enemy
+          JawWorm the enemy in the battle.
+        deck
+          List Current character draw pile.
+        turn
+          int Turn about to start.
+        """
+        return self.lookup(character.hp, enemy.hp, enemy.strength // 3,
+                           enemy_history(enemy, turn), deck_counts(deck))
+
+    def hint(self, character, enemy, hand, deck, move, turn):
+        """Returns the cards the policy would play from the current
+        hand, in CARD_TYPES order, and the chance of winning if they
+        are played.
+
+        character
+          Character current player character.
+        enemy
+          JawWorm the enemy in the battle.
+        hand
+          List Current character hand.
+        deck
+          List Current character draw pile.
+        move
+          int Move the Jaw Worm intends to use this turn.
+        turn
+          int Current turn number.
+        """
+        history = enemy_history(enemy, turn)
+        bellows = enemy.strength // 3
+        hand = deck_counts(hand)
+        played = self.policy(hand, move, 3 * bellows)
+        dealt, taken, move = turn_outcome(played, history, bellows, move)
+        if dealt >= enemy.hp:
+            return played, 1.0
+        return played, self.lookup(character.hp - taken, enemy.hp - dealt,
+                                   bellows + (move == BELLOW),
+                                   next_history(history, move),
+                                   deck_counts(deck))
+
+
+def enemy_history(enemy, turn):
+    """Returns the move history of a JawWorm on the given turn."""
+    if turn == 1:
+        return START
+    if enemy.lastattack == CHOMP:
+        return AFTER_CHOMP
+    if enemy.lastattack == BELLOW:
+        return AFTER_BELLOW
+    if enemy.lastlastattack == THRASH:
+        return THRASH2
+    return AFTER_THRASH
+
+
+def main(argv=None):
+    """Command line entry point, run with python -m spire.oracle."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m spire.oracle',
+                                     description="Build or query a Jaw Worm"
+                                     " win probability table.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build_parser = commands.add_parser('build', help="solve and write a"
+                                       " table")
+    build_parser.add_argument('path')
+    build_parser.add_argument('--policy', default='greedy',
+                              choices=registry.names('policy'))
+    build_parser.add_argument('--max-bellows', type=int, default=12)
+    query_parser = commands.add_parser('query', help="print the chance of"
+                                       " winning a new battle")
+    query_parser.add_argument('path')
+    query_parser.add_argument('enemy_hp', type=int)
+    query_parser.add_argument('--player-hp', type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        if args.max_bellows < 1:
+            parser.error("--max-bellows must be at least 1.")
+        build(args.path, args.policy, max_bellows=args.max_bellows, log=print)
+    else:
+        try:
+            oracle = Oracle(args.path)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        with oracle:
+            php = args.player_hp
+            if php is None:
+                php = oracle.dims['player_hp']
+            if not 1 <= php <= oracle.dims['player_hp']:
+                parser.error(f"--player-hp must be between 1 and"
+                             f" {oracle.dims['player_hp']}.")
+            if not 1 <= args.enemy_hp <= oracle.dims['enemy_hp']:
+                parser.error(f"enemy_hp must be between 1 and"
+                             f" {oracle.dims['enemy_hp']}.")
+            chance = oracle.lookup(php, args.enemy_hp, 0, START, oracle.deck)
+            print(f"{chance:.1%}")
+
+
+if __name__ == '__main__':
+    main()
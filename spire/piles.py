@@ -0,0 +1,52 @@
+"""Moving cards between the draw pile, hand and discard pile."""
+
+import random
+
+from .display import print_card_list
+
+def draw(deck, disc, hand, n=1):
+    """Draws n cards from the deck and puts them in hand, shuffling disc
+    into deck first if deck is empty. Returns the new state of deck,
+    discard, and hand.
+    
+    deck
+      List containing card objects.
+    disc
+      List containing card objects.
+    hand
+      List containing card objects.
+    """
+    for i in range(n):
+        if deck == [] and disc == []:
+            return hand, deck, disc
+        elif deck == []:
+            deck = random.sample(disc, len(disc))
+            disc = []
+            hand.append(deck.pop())
+        else:
+            hand.append(deck.pop())
+    return deck, disc, hand
+
+def discard(deck, disc, hand, n=1):
+    """Discards n cards from hand and puts them in disc, prompting the
+    user to select a card to discard each time unless there is only one
+    choice available. Returns new state of deck, disc and hand.
+    
+    deck
+      List containing card objects.
+    disc
+      List containing card objects.
+    hand
+      List containing card objects.
+    """
+    for i in range(n):
+        if hand == []:
+            return deck, disc, hand
+        elif len(hand) <= n:
+            disc.extend(hand)
+            hand = []
+        else:
+            print("Which card would you like to discard? ")
+            print_card_list(hand)
+            disc.append(hand.pop(int(input())-1))
+    return deck, disc, hand
@@ -0,0 +1,62 @@
+"""Registry of the cards, characters and enemies in the game, and of
+the card play policies used to solve battles.
+
+Entries are registered by name as "module:attribute" strings, and the
+module is only imported the first time the entry is resolved, so that
+importing the package stays cheap for worker processes that never
+touch most of the content.
+"""
+
+import importlib
+
+# _entries maps each kind of entry to a dict of lowercase names and the
+# "module:attribute" path or object registered under that name.
+_entries = {'card': {}, 'character': {}, 'enemy': {}, 'policy': {}}
+
+
+def register(kind, name, target):
+    """Registers a card, character, enemy or policy under a name.
+
+    kind
+      str One of 'card', 'character', 'enemy' or 'policy'.
+    name
+      str Name used to look the entry up, case insensitive.
+    target
+      str "module:attribute" path of the entry, or the entry itself.
+    """
+    _entries[kind][name.lower()] = target
+
+
+def resolve(kind, name):
+    """Returns the entry registered under name, importing its module
+    on first use.
+
+    kind
+      str One of 'card', 'character', 'enemy' or 'policy'.
+    name
+      str Name the entry was registered under, case insensitive.
+    """
+    try:
+        target = _entries[kind][name.lower()]
+    except KeyError:
+        raise KeyError(f"No {kind} named {name!r}. Choose from:"
+                        f" {', '.join(names(kind))}.") from None
+    if isinstance(target, str):
+        module, attribute = target.split(':')
+        target = getattr(importlib.import_module(module), attribute)
+        _entries[kind][name.lower()] = target
+    return target
+
+
+def names(kind):
+    """Returns the sorted names registered for a kind of entry."""
+    return sorted(_entries[kind])
+
+
+for _card in ('Strike', 'Defend', 'Survivor', 'Neutralize', 'Acrobatics',
+              'Backflip'):
+    register('card', _card, f'spire.cards:{_card}')
+register('character', 'Silent', 'spire.characters:Silent')
+register('enemy', 'Cultist', 'spire.enemies:Cultist')
+register('enemy', 'JawWorm', 'spire.enemies:JawWorm')
+register('policy', 'greedy', 'spire.oracle:greedy_policy')
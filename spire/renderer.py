@@ -0,0 +1,246 @@
+"""Full-screen curses renderer used for interactive play."""
+
+import sys
+
+try:
+    import curses
+except ImportError: # curses is not available on Windows.
+    curses = None
+
+from .display import being_line, card_line
+
+
+class _ScreenWriter:
+    """File-like object that stands in for sys.stdout and sys.stdin
+    while a TerminalRenderer is active, so that the print and input
+    calls made by the game logic are routed through the renderer.
+    """
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.pending = ''
+
+    def write(self, text):
+        lines = (self.pending + text).split('\n')
+        self.pending = lines.pop()
+        for line in lines:
+            self.renderer.log(line)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def readline(self):
+        prompt, self.pending = self.pending, ''
+        return self.renderer.prompt(prompt) + '\n'
+
+
+class TerminalRenderer:
+    """Full-screen curses renderer used for interactive play.
+
+    The renderer keeps a model of the screen as a list of rows, built
+    from the state of the battle it was given through show_battle().
+    Drawing a frame only rewrites the rows that changed since the last
+    one, and all changes made between two frames are coalesced into a
+    single refresh of the terminal.
+
+    Frames are drawn whenever the user is prompted for input, and at
+    the intermediate steps of a battle requested through frame(), such
+    as each card played and each enemy action, which stay on screen for
+    delay seconds before the battle advances on its own. With
+    fast_forward set, intermediate frames are skipped and the screen is
+    only brought up to date when input is needed. Cards are never
+    played automatically.
+
+    Used as a context manager; while active, printed messages are shown
+    in the log region, the last prompt is shown on the second to last
+    row and input is read from the last row.
+    """
+
+    # Smallest terminal the renderer can lay a battle out on, before
+    # counting the rows needed for each enemy.
+    MIN_COLUMNS = 40
+    MIN_LINES = 20
+    # Rows reserved for the hand region, its title included. The log
+    # region gives up its rows before the hand region does.
+    HAND_ROWS = 11
+
+    def __init__(self, fast_forward=False, delay=0.3, log_size=100):
+        if curses is None:
+            raise RuntimeError("curses is not available on this platform.")
+        self.fast_forward = fast_forward
+        self.delay = delay
+        # battle holds the objects passed to show_battle(), read again
+        # every frame so that the screen follows the battle as it goes.
+        self.battle = None
+        # drawn holds the rows currently on screen, or None for rows
+        # that must be rewritten next frame.
+        self.drawn = []
+        self.size = None
+        self.messages = []
+        self.log_size = log_size
+        self.prompt_text = ''
+        self.screen = None
+
+    def __enter__(self):
+        self.screen = curses.initscr()
+        curses.noecho()
+        curses.cbreak()
+        self.screen.keypad(True)
+        self.writer = _ScreenWriter(self)
+        self.stdout, self.stdin = sys.stdout, sys.stdin
+        sys.stdout = sys.stdin = self.writer
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.stdout, sys.stdin = self.stdout, self.stdin
+        self.screen.keypad(False)
+        curses.nocbreak()
+        curses.echo()
+        curses.endwin()
+        # Leaves the last messages, such as the result of the battle,
+        # on the terminal once the screen is torn down.
+        for line in self.messages[-5:]:
+            print(line)
+        return False
+
+    @classmethod
+    def fits(cls, columns, lines, enemies):
+        """Returns whether a battle against a number of enemies can be
+        laid out on a terminal of the given size, with room for a full
+        hand.
+
+        columns
+          int Width of the terminal.
+        lines
+          int Height of the terminal.
+        enemies
+          int Number of enemies in the battle.
+        """
+        # The turn, each enemy and its intent, the player, the hand, the
+        # prompt and the input.
+        needed = 1 + 2 * enemies + 1 + cls.HAND_ROWS + 2
+        return columns >= cls.MIN_COLUMNS and lines >= max(cls.MIN_LINES,
+                                                           needed)
+
+    def log(self, line):
+        """Adds a message to the log region."""
+        self.messages.append(line)
+        del self.messages[:-self.log_size]
+
+    def show_battle(self, turn, character, enemies, intents, hand):
+        """Sets the battle shown on screen. The objects are read again
+        every frame, so changes to them, such as cards leaving the hand
+        while a card is being played, show up without calling this
+        again. The change is only drawn at the next frame.
+
+        turn
+          int Current turn number.
+        character
+          Character current player character.
+        enemies
+          List containing the Enemy objects in the battle.
+        intents
+          List containing the action_intent tuple of each enemy.
+        hand
+          List Current character hand.
+        """
+        self.battle = (turn, character, enemies, intents, hand)
+
+    def frame(self):
+        """Draws an intermediate frame and leaves it on screen for
+        delay seconds, unless fast forwarding.
+        """
+        if not self.fast_forward:
+            self.draw()
+            curses.napms(int(self.delay * 1000))
+
+    def prompt(self, text):
+        """Draws the screen and reads a line of input from the user.
+
+        text
+          str Prompt displayed above the input row.
+        """
+        self.prompt_text = text
+        while True:
+            self.draw()
+            height, width = self.screen.getmaxyx()
+            curses.echo()
+            try:
+                answer = self.screen.getstr(height - 1, 2, max(width - 3, 1))
+            except curses.error:
+                answer = b''
+            finally:
+                curses.noecho()
+            # The typed input is on screen but not in the model, so the
+            # input row must be rewritten next frame.
+            if len(self.drawn) == height:
+                self.drawn[height - 1] = None
+            # Resizing the terminal interrupts the input, which is read
+            # again once the screen is redrawn at the new size.
+            if self.screen.getmaxyx() == (height, width):
+                break
+        answer = answer.decode(errors='replace')
+        self.log(f"> {answer}")
+        return answer
+
+    def rows(self, height):
+        """Returns the text of every row of a screen with the given
+        height.
+        """
+        top = []
+        hand = []
+        if self.battle is not None:
+            turn, character, enemies, intents, cards = self.battle
+            top = ([f"TURN {turn}"]
+                   + [f"{x[0]+1} | {being_line(x[1])}"
+                      for x in enumerate(enemies)]
+                   + [f"{x[0]+1} | {x[1][0].strip()}"
+                      for x in enumerate(intents)]
+                   + [f"{being_line(character)} | Energy:"
+                      f" {character.current_mana}"])
+            hand = (["Cards in hand:"]
+                    + [card_line(x[0], x[1]) for x in enumerate(cards)])
+        # The last two rows hold the prompt and the input.
+        free = height - 2 - len(top) - len(hand)
+        if free < 0:
+            # Cutting rows would hide enemies or cards the prompt asks
+            # for by index.
+            body = [f"The terminal needs {height - free} rows to show the"
+                    " battle."]
+        else:
+            # The hand region is padded to HAND_ROWS when there is room,
+            # so the log does not move as cards are played.
+            hand += [''] * min(self.HAND_ROWS - len(hand), free)
+            log_rows = height - 2 - len(top) - len(hand)
+            log = self.messages[-log_rows:] if log_rows else []
+            body = top + hand + log + [''] * (log_rows - len(log))
+        body = body[:max(height - 2, 0)]
+        body += [''] * (height - 2 - len(body))
+        rows = body + [self.prompt_text, '> ']
+        return rows[-height:]
+
+    def draw(self):
+        """Writes the rows that changed since the last frame to the
+        terminal, and refreshes it once.
+        """
+        height, width = self.screen.getmaxyx()
+        if (height, width) != self.size:
+            # Rows drawn at the old size are no longer where the model
+            # thinks they are.
+            self.size = (height, width)
+            self.drawn = []
+            self.screen.clear()
+        rows = self.rows(height)
+        for row, line in enumerate(rows):
+            line = line[:width - 1]
+            if row < len(self.drawn) and self.drawn[row] == line:
+                continue
+            try:
+                self.screen.move(row, 0)
+                self.screen.clrtoeol()
+                self.screen.addstr(row, 0, line)
+            except curses.error:
+                pass
+        self.drawn = [line[:width - 1] for line in rows]
+        self.screen.noutrefresh()
+        curses.doupdate()
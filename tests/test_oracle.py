@@ -0,0 +1,159 @@
+"""Checks the Jaw Worm win probability table against the game itself."""
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from spire import oracle
+from spire.characters import Silent
+from spire.enemies import JawWorm
+
+
+def rollout(php, ehp, bellows, history):
+    """Plays a battle with the real game classes from the start of a
+    turn with the whole deck in the draw pile, choosing cards with
+    greedy_policy, and returns whether the player won.
+    """
+    character = Silent()
+    character.hp = php
+    enemy = JawWorm(maxhp=ehp)
+    enemy.strength = 3 * bellows
+    enemy.block = oracle.ENEMY_BLOCK[history]
+    enemy.lastattack, enemy.lastlastattack = {
+        oracle.AFTER_CHOMP: (0, 0), oracle.AFTER_BELLOW: (2, 0),
+        oracle.AFTER_THRASH: (1, 0), oracle.THRASH2: (1, 1)}[history]
+    deck = random.sample(character.deck, len(character.deck))
+    disc, hand, exha = [], [], []
+    # Any turn after the first rolls intents from the move history.
+    turn = 1
+    try:
+        while True:
+            deck, disc, hand, exha = character.start_turn(deck, disc, hand,
+                                                          exha)
+            turn += 1
+            move = enemy.action_intent(character, turn)[1]
+            plan = list(oracle.greedy_policy(oracle.deck_counts(hand), move,
+                                             enemy.strength))
+            # Neutralize, Survivor, Defends and then Strikes.
+            for kind in (3, 2, 1, 0):
+                while plan[kind]:
+                    card = next(card for card in hand
+                                if card.name == oracle.CARD_TYPES[kind])
+                    hand.remove(card)
+                    plan[kind] -= 1
+                    # Survivor discards a card the plan does not need.
+                    spare = next((i for i, card in enumerate(hand)
+                                  if sum(c.name == card.name for c in hand)
+                                  > plan[oracle.CARD_TYPES.index(card.name)]),
+                                 0)
+                    with mock.patch('builtins.input',
+                                    return_value=str(spare + 1)):
+                        deck, disc, hand, exha = card.play(
+                            character, enemy, deck, disc, hand, exha)
+                    character.current_mana -= card.cost
+                    disc.append(card)
+            deck, disc, hand, exha = character.end_turn(deck, disc, hand,
+                                                        exha)
+            enemy.start_turn()
+            enemy.action(character, move)
+            enemy.end_turn()
+    except SystemExit:
+        return enemy.hp <= 0
+
+
+class TestOracle(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(cls.directory.name, 'jawworm.table')
+        oracle.build(path, enemy_maxhp=14, max_bellows=4)
+        cls.oracle = oracle.Oracle(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.oracle.close()
+        cls.directory.cleanup()
+
+    def test_lookup_matches_rollouts(self):
+        random.seed(0)
+        games = 2000
+        for php, ehp, bellows, history in ((8, 14, 3, oracle.AFTER_BELLOW),
+                                           (5, 11, 2, oracle.AFTER_THRASH)):
+            expected = self.oracle.lookup(php, ehp, bellows, history,
+                                          self.oracle.deck)
+            with contextlib.redirect_stdout(io.StringIO()):
+                wins = sum(rollout(php, ehp, bellows, history)
+                           for _ in range(games))
+            # Four standard deviations of the simulated win rate.
+            margin = 4 * (expected * (1 - expected) / games) ** 0.5
+            self.assertAlmostEqual(wins / games, expected, delta=margin)
+
+    def test_lookup_bounds(self):
+        deck = self.oracle.deck
+        self.assertEqual(self.oracle.lookup(0, 10, 0, oracle.START, deck), 0.0)
+        self.assertEqual(self.oracle.lookup(10, 0, 0, oracle.START, deck), 1.0)
+        with self.assertRaises(ValueError):
+            self.oracle.lookup(10, 15, 0, oracle.START, deck)
+
+
+class TestDraws(unittest.TestCase):
+
+    deck = (5, 5, 1, 1)
+
+    def test_draw_from_pile(self):
+        pile = (3, 2, 1, 1)
+        results = list(oracle.draws(pile, self.deck, 5))
+        self.assertAlmostEqual(sum(chance for _, _, chance in results), 1.0)
+        for hand, left, chance in results:
+            self.assertEqual(sum(hand), 5)
+            self.assertEqual(tuple(a + b for a, b in zip(hand, left)), pile)
+
+    def test_draw_with_reshuffle(self):
+        pile = (1, 0, 1, 0)
+        results = list(oracle.draws(pile, self.deck, 5))
+        self.assertAlmostEqual(sum(chance for _, _, chance in results), 1.0)
+        for hand, left, chance in results:
+            self.assertEqual(sum(hand), 5)
+            self.assertEqual(sum(left), 7)
+            self.assertTrue(all(a >= b for a, b in zip(hand, pile)))
+            self.assertEqual(tuple(a + b for a, b in zip(hand, left)),
+                             self.deck)
+
+    def test_reachable_piles(self):
+        piles = oracle.reachable_piles(self.deck, 5)
+        self.assertEqual(piles[0], self.deck)
+        self.assertEqual(len(piles), len(set(piles)))
+        self.assertEqual({sum(pile) for pile in piles}, {12, 7, 2})
+
+
+class TestEnemyHistory(unittest.TestCase):
+
+    def history(self, moves):
+        """Returns the history of a JawWorm after using moves."""
+        enemy = JawWorm()
+        target = Silent()
+        target.hp = target.maxhp = 1000
+        with contextlib.redirect_stdout(io.StringIO()):
+            for move in moves:
+                enemy.action(target, move)
+        return oracle.enemy_history(enemy, len(moves) + 1)
+
+    def test_first_turn(self):
+        self.assertEqual(self.history([]), oracle.START)
+
+    def test_matches_next_history(self):
+        for moves in ([0], [2], [1], [0, 1], [1, 1], [1, 2], [2, 1],
+                      [1, 1, 0]):
+            expected = oracle.START
+            for move in moves:
+                expected = oracle.next_history(expected, move)
+            self.assertEqual(self.history(moves), expected, moves)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Checks that importing the package stays free of side effects and
+only loads game content when it is used.
+"""
+
+import os
+import random
+import subprocess
+import sys
+import unittest
+
+from spire.enemies import Cultist, JawWorm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(code):
+    """Runs code in a fresh interpreter from the repository root, and
+    returns the completed process.
+    """
+    return subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                          capture_output=True, text=True, timeout=60)
+
+
+class TestImports(unittest.TestCase):
+
+    def test_import_has_no_side_effects(self):
+        result = run("import spire, spire.combat, spire.__main__")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout, '')
+        self.assertEqual(result.stderr, '')
+
+    def test_import_does_not_load_content(self):
+        result = run("import sys, spire, spire.combat, spire.__main__\n"
+                     "for name in ('spire.cards', 'spire.enemies',"
+                     " 'spire.oracle', 'curses'):\n"
+                     "    print(name, name in sys.modules)")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split('\n'),
+                         ['spire.cards False', 'spire.enemies False',
+                          'spire.oracle False', 'curses False', ''])
+
+    def test_registry_resolves_lazily(self):
+        result = run("import sys\n"
+                     "from spire import registry\n"
+                     "print('spire.enemies' in sys.modules)\n"
+                     "enemy = registry.resolve('enemy', 'jawworm')\n"
+                     "print('spire.enemies' in sys.modules)\n"
+                     "print(enemy is sys.modules['spire.enemies'].JawWorm)\n"
+                     "print(registry.resolve('enemy', 'JawWorm') is enemy)")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split('\n'),
+                         ['False', 'True', 'True', 'True', ''])
+
+
+class TestEnemyHp(unittest.TestCase):
+
+    def test_max_hp_rolled_per_instance(self):
+        random.seed(0)
+        for enemy in (JawWorm, Cultist):
+            rolls = {enemy().maxhp for _ in range(50)}
+            self.assertGreater(len(rolls), 1)
+            self.assertTrue(all(enemy.HP_RANGE[0] <= hp <= enemy.HP_RANGE[1]
+                                for hp in rolls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Checks the layout and row diffing of the full-screen renderer."""
+
+import unittest
+from unittest import mock
+
+from spire import renderer
+from spire.cards import Defend, Strike
+from spire.characters import Silent
+from spire.enemies import JawWorm
+
+
+class StubScreen:
+    """Stands in for a curses window, recording the rows written."""
+
+    def __init__(self, height, width):
+        self.size = (height, width)
+        self.written = []
+
+    def getmaxyx(self):
+        return self.size
+
+    def move(self, row, column):
+        pass
+
+    def clrtoeol(self):
+        pass
+
+    def clear(self):
+        pass
+
+    def addstr(self, row, column, text):
+        self.written.append((row, text))
+
+    def noutrefresh(self):
+        pass
+
+
+@unittest.skipIf(renderer.curses is None, "curses is not available")
+class TestRenderer(unittest.TestCase):
+
+    def battle(self, enemies=1, cards=5):
+        """Returns a renderer showing a battle, and its enemies."""
+        screen = renderer.TerminalRenderer()
+        enemylist = [JawWorm(maxhp=42) for _ in range(enemies)]
+        intents = [(f"Jaw Worm is going to attack you for {11 + i}"
+                    " damage!", 0) for i in range(enemies)]
+        hand = [Strike() if i % 2 else Defend() for i in range(cards)]
+        screen.show_battle(1, Silent(), enemylist, intents, hand)
+        screen.prompt_text = "Enter the index of the card to play it."
+        for i in range(30):
+            screen.log(f"message {i}")
+        return screen, enemylist
+
+    def test_layout(self):
+        screen, enemies = self.battle()
+        rows = screen.rows(24)
+        self.assertEqual(len(rows), 24)
+        self.assertEqual(rows[0], "TURN 1")
+        self.assertTrue(rows[1].startswith("1 | Jaw Worm"))
+        self.assertEqual(rows[2], "1 | Jaw Worm is going to attack you for 11"
+                         " damage!")
+        self.assertEqual(rows[4], "Cards in hand:")
+        self.assertTrue(rows[9].startswith("5 : Defend"))
+        # The hand region is padded to HAND_ROWS, and the log takes the
+        # rest, ending with the newest message.
+        self.assertEqual(rows[15:22], [f"message {i}" for i in range(23, 30)])
+        self.assertEqual(rows[-2:], [screen.prompt_text, '> '])
+
+    def test_log_shrinks_before_hand(self):
+        screen, enemies = self.battle(enemies=4)
+        rows = screen.rows(20)
+        self.assertEqual(len(rows), 20)
+        self.assertEqual(rows[0], "TURN 1")
+        self.assertEqual([row[:1] for row in rows[1:9]], list('12341234'))
+        self.assertTrue(rows[15].startswith("5 : Defend"))
+        self.assertFalse(any(row.startswith("message") for row in rows))
+        self.assertEqual(rows[-2:], [screen.prompt_text, '> '])
+
+    def test_too_small(self):
+        screen, enemies = self.battle(enemies=4)
+        rows = screen.rows(12)
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(rows[0], "The terminal needs 18 rows to show the"
+                         " battle.")
+        self.assertEqual(rows[-2:], [screen.prompt_text, '> '])
+
+    def test_fits(self):
+        cls = renderer.TerminalRenderer
+        self.assertTrue(cls.fits(80, 20, 1))
+        self.assertFalse(cls.fits(80, 20, 4))
+        self.assertTrue(cls.fits(80, 23, 4))
+        self.assertFalse(cls.fits(39, 40, 1))
+
+    @mock.patch.object(renderer.curses, 'doupdate')
+    def test_draw_only_writes_changed_rows(self, doupdate):
+        screen, enemies = self.battle()
+        screen.screen = StubScreen(24, 80)
+        screen.draw()
+        self.assertEqual(len(screen.screen.written), 24)
+        screen.screen.written.clear()
+        screen.draw()
+        self.assertEqual(screen.screen.written, [])
+        enemies[0].hp -= 6
+        screen.draw()
+        self.assertEqual([row for row, text in screen.screen.written], [1])
+        self.assertEqual(doupdate.call_count, 3)
+
+    @mock.patch.object(renderer.curses, 'doupdate')
+    def test_draw_after_resize(self, doupdate):
+        screen, enemies = self.battle()
+        screen.screen = StubScreen(24, 80)
+        screen.draw()
+        screen.screen.written.clear()
+        screen.screen.size = (30, 80)
+        screen.draw()
+        self.assertEqual(len(screen.screen.written), 30)
+
+
+if __name__ == '__main__':
+    unittest.main()